@@ -0,0 +1,154 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from config import *
+from BLL.ServerConnectionManager import ServerConnectionManager
+from BLL.ServerCommandFactory import ServerCommandFactory
+from BLL.ConnectionDispatcher import handle_session_request
+from Models.MessageProtocol import MessageProtocol
+from Models.MessageFraming import FRAME_HEADER, encode_frame
+
+
+class AsyncServerConnectionManager(ServerConnectionManager):
+    """Silnik serwera oparty o asyncio (asyncio.start_server).
+
+    Bezczynne połączenia nie zajmują wątków - czekają na pętli zdarzeń.
+    Przetwarzanie żądania (ServerCommandFactory.process_request) zawiera blokujące
+    wywołania repozytoriów (psycopg2, pliki JSON), dlatego jest wykonywane
+    w puli wątków executora, aby nigdy nie blokować pętli zdarzeń.
+    """
+
+    def __init__(self, session_factory=ServerCommandFactory, executor_workers=None):
+        super().__init__()
+        self.session_factory = session_factory
+        self.executor_workers = executor_workers or SERVER_CONFIG["executor_workers"]
+        self._executor = None
+        self._server = None
+        self._connections = set()
+
+    @property
+    def active_connections(self):
+        """Liczba aktualnie otwartych połączeń"""
+        return len(self._connections)
+
+    async def start_server(self):
+        """Uruchomienie serwera asyncio"""
+        self._executor = ThreadPoolExecutor(max_workers=self.executor_workers,
+                                            thread_name_prefix="db-executor")
+        try:
+            self._server = await asyncio.start_server(
+                self._handle_connection, self.host, self.port,
+                backlog=self.max_connections, reuse_address=True
+            )
+        except OSError as e:
+            self._executor.shutdown(wait=False)
+            print(f"Błąd systemu operacyjnego: {e}")
+            raise ConnectionError(f"Nie można uruchomić serwera: {e}")
+        print(f"Serwer (asyncio) nasłuchuje na {self.host}:{self.port}")
+
+    async def stop_server(self, timeout=None):
+        """Zamyka gniazdo nasłuchujące, aktywne połączenia i executor"""
+        timeout = SERVER_CONFIG["shutdown_timeout"] if timeout is None else timeout
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        for writer in list(self._connections):
+            writer.close()
+        if self._connections:
+            await asyncio.wait([asyncio.ensure_future(w.wait_closed()) for w in list(self._connections)],
+                               timeout=timeout)
+
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        print("Serwer został zamknięty.")
+
+    async def serve_forever(self):
+        if not self._server:
+            raise ConnectionError("Serwer nie został uruchomiony")
+        await self._server.serve_forever()
+
+    async def _run_blocking(self, func, *args):
+        """Wykonuje blokującą operację w executorze"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _read_frame(self, reader):
+        """Odczytuje jedną ramkę żądania; None gdy klient zamknął połączenie między ramkami"""
+        try:
+            header = await reader.readexactly(FRAME_HEADER.size)
+        except asyncio.IncompleteReadError as e:
+            if e.partial:
+                raise ConnectionError("Połączenie zostało przerwane w trakcie odbierania ramki")
+            return None
+
+        (length,) = FRAME_HEADER.unpack(header)
+        if length > MAX_REQUEST_SIZE:
+            raise ValueError(f"Dane przekraczają maksymalny rozmiar {MAX_REQUEST_SIZE}")
+        try:
+            return await reader.readexactly(length)
+        except asyncio.IncompleteReadError:
+            raise ConnectionError("Połączenie zostało przerwane w trakcie odbierania ramki")
+
+    async def _send_response(self, writer, response_dto):
+        writer.write(encode_frame(response_dto.to_json().encode("utf-8")))
+        await writer.drain()
+
+    async def _handle_connection(self, reader, writer):
+        address = writer.get_extra_info("peername")
+        print(f"Połączono z klientem: {address}")
+        self._connections.add(writer)
+        user_manager = self.session_factory()
+
+        try:
+            while True:
+                data = await asyncio.wait_for(self._read_frame(reader), CONNECTION_TIMEOUT)
+                if data is None:  # Klient zamknął połączenie
+                    break
+
+                try:
+                    raw_request = self.parse_request(data.decode("utf-8"))
+                except (ValueError, TypeError, UnicodeDecodeError) as e:
+                    error_dto = MessageProtocol.create_error_response(f"Nieprawidłowe żądanie: {e}", "INVALID_REQUEST")
+                    await self._send_response(writer, error_dto)
+                    continue
+
+                response_dto, end_session = await self._run_blocking(
+                    handle_session_request, user_manager, raw_request, address
+                )
+                await self._send_response(writer, response_dto)
+                if end_session:
+                    break
+
+        except ValueError as e:
+            # Nagłówek ramki jest nieprawidłowy - strumień nie nadaje się do dalszego odczytu
+            print(f"Odrzucono żądanie klienta {address}: {e}")
+        except asyncio.TimeoutError:
+            print(f"Przekroczono czas oczekiwania na żądanie klienta {address}")
+        except (ConnectionError, OSError) as e:
+            print(f"Błąd połączenia z klientem {address}: {e}")
+        except Exception as e:
+            print(f"Błąd podczas obsługi klienta {address}: {e}")
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+            print(f"Zamknięto połączenie z klientem {address}")
+
+    async def _main(self):
+        await self.start_server()
+        try:
+            await self.serve_forever()
+        finally:
+            await self.stop_server()
+
+    def run(self):
+        """Uruchamia serwer asyncio do momentu przerwania (Ctrl+C)"""
+        try:
+            asyncio.run(self._main())
+        except KeyboardInterrupt:
+            print("\nZamykanie serwera...")
@@ -5,6 +5,7 @@ from datetime import datetime
 import json
 from config import *
 from Models.MessageProtocol import RequestDTO, ResponseDTO
+from Models.MessageFraming import FrameReader, send_frame
 
 class ClientConnectionManager():
     def __init__(self):
@@ -24,6 +25,7 @@ class ClientConnectionManager():
                 self.client_socket = s.socket(s.AF_INET, s.SOCK_STREAM)
                 self.client_socket.settimeout(CONNECTION_TIMEOUT)
                 self.client_socket.connect((self.host, self.port))
+                self._frame_reader = FrameReader(self.client_socket, SERVER_CONFIG["buffer_size"], MAX_FRAME_SIZE)
                 print(f"Połączenie nawiązane pomyślnie")
                 return self
                 
@@ -66,13 +68,13 @@ class ClientConnectionManager():
             if len(json_request.encode('utf-8')) > MAX_REQUEST_SIZE:
                 raise ValueError(f"Request przekracza maksymalny rozmiar {MAX_REQUEST_SIZE}")
             
-            # Wyślij żądanie
+            # Wyślij żądanie jako ramkę (nagłówek z długością + JSON)
             bytes_to_send = json_request.encode("utf-8")
-            self.client_socket.send(bytes_to_send)
+            send_frame(self.client_socket, bytes_to_send)
             
-            # Odbierz odpowiedź
-            response_bytes = self.client_socket.recv(SERVER_CONFIG["buffer_size"])
-            if not response_bytes:
+            # Odbierz odpowiedź - ramka może przyjść w wielu segmentach TCP
+            response_bytes = self._frame_reader.read_frame()
+            if response_bytes is None:
                 raise ConnectionError("Serwer zamknął połączenie")
             json_response = response_bytes.decode("utf-8")
             #print(f"🔍 DEBUG CLIENT - Received response: {json_response}")
@@ -0,0 +1,141 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config import *
+from BLL.ServerCommandFactory import ServerCommandFactory
+from Models.MessageProtocol import RequestDTO, MessageProtocol
+
+
+def handle_session_request(user_manager, raw_request, address):
+    """Wykonuje żądanie [command, data] w sesji klienta.
+
+    Zwraca krotkę (ResponseDTO, czy_zakończyć_sesję) - wspólne dla silnika
+    wątkowego i asyncio.
+    """
+    try:
+        # raw_request jest zawsze listą z ServerConnectionManager [command, data]
+        command, data = raw_request[0], raw_request[1]
+        request_dto = RequestDTO(command=command, data=data)
+
+        # Specjalna obsługa logout
+        if request_dto.command == "logout":
+            print(f"Klient {address} się wylogował")
+            return MessageProtocol.create_success_response("OK"), True
+
+        # Przetwórz żądanie przez CommandFactory
+        return user_manager.process_request(request_dto), False
+
+    except json.JSONDecodeError as e:
+        print(f"Błąd parsowania JSON: {e}")
+        return MessageProtocol.create_error_response("Błąd parsowania żądania", "JSON_PARSE_ERROR"), False
+    except Exception as e:
+        print(f"Błąd przetwarzania żądania: {e}")
+        return MessageProtocol.create_error_response(f"Błąd serwera: {str(e)}", "SERVER_ERROR"), False
+
+
+class ConnectionDispatcher():
+    """Przekazuje zaakceptowane połączenia do ograniczonej puli wątków roboczych.
+
+    Każde połączenie dostaje własną sesję ServerCommandFactory (własny current_user).
+    Gdy wszystkie wątki są zajęte, dispatch() blokuje pętlę accept - nowi klienci
+    czekają w kolejce listen zamiast zajmować pamięć w nieograniczonej kolejce zadań.
+    """
+
+    def __init__(self, server, pool_size=None, session_factory=ServerCommandFactory):
+        self.server = server
+        self.pool_size = pool_size or SERVER_CONFIG["worker_pool_size"]
+        self.session_factory = session_factory
+        self._executor = ThreadPoolExecutor(max_workers=self.pool_size,
+                                            thread_name_prefix="client-worker")
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        self._active_sockets = set()
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    @property
+    def active_connections(self):
+        """Liczba aktualnie obsługiwanych połączeń"""
+        with self._lock:
+            return len(self._active_sockets)
+
+    def dispatch(self, client_socket, address, timeout=None):
+        """Przekazuje połączenie do puli; zwraca False gdy dispatcher jest zamykany lub brak miejsca"""
+        if self._stopping.is_set():
+            client_socket.close()
+            return False
+
+        if not self._slots.acquire(timeout=timeout):
+            print(f"Brak wolnych wątków - odrzucono klienta {address}")
+            client_socket.close()
+            return False
+
+        with self._lock:
+            self._active_sockets.add(client_socket)
+        try:
+            self._executor.submit(self._run_session, client_socket, address)
+        except RuntimeError:
+            # Executor został już zamknięty
+            self._release(client_socket)
+            client_socket.close()
+            return False
+        return True
+
+    def _release(self, client_socket):
+        with self._lock:
+            self._active_sockets.discard(client_socket)
+        self._slots.release()
+
+    def _run_session(self, client_socket, address):
+        try:
+            self.serve_client(client_socket, address)
+        except Exception as e:
+            print(f"Błąd podczas obsługi klienta {address}: {e}")
+        finally:
+            try:
+                client_socket.close()
+            except OSError:
+                pass
+            self.server.release_client(client_socket)
+            self._release(client_socket)
+            print(f"Zamknięto połączenie z klientem {address}")
+
+    def serve_client(self, client_socket, address):
+        """Pętla obsługi pojedynczego klienta - jedna sesja na połączenie"""
+        print(f"Połączono z klientem: {address}")
+        user_manager = self.session_factory()
+
+        while not self._stopping.is_set():
+            raw_request = self.server.handle_client(client_socket)
+            if not raw_request:  # Jeśli nie ma danych, bo połączenie zostało przerwane
+                break
+
+            response_dto, end_session = handle_session_request(user_manager, raw_request, address)
+            self.server.send_response(client_socket, response_dto)
+            if end_session:
+                break
+
+    def shutdown(self, timeout=None):
+        """Zatrzymuje przyjmowanie połączeń i czeka na zakończenie aktywnych sesji.
+
+        Po upływie timeout pozostałe połączenia są zamykane, co przerywa
+        blokujące recv() w wątkach roboczych.
+        """
+        timeout = SERVER_CONFIG["shutdown_timeout"] if timeout is None else timeout
+        self._stopping.set()
+
+        drained = threading.Event()
+        waiter = threading.Thread(target=lambda: (self._executor.shutdown(wait=True), drained.set()),
+                                  daemon=True)
+        waiter.start()
+
+        if not drained.wait(timeout):
+            with self._lock:
+                remaining = list(self._active_sockets)
+            print(f"Zamykanie {len(remaining)} aktywnych połączeń...")
+            for client_socket in remaining:
+                try:
+                    client_socket.shutdown(2)  # SHUT_RDWR
+                except OSError:
+                    pass
+            drained.wait(timeout)
+        print("Pula wątków obsługi klientów została zamknięta.")
@@ -2,6 +2,8 @@ import socket as s
 from datetime import datetime
 from config import *
 import json
+import threading
+from Models.MessageFraming import FrameReader, send_frame
 
 class ServerConnectionManager():
     def __init__(self):
@@ -10,6 +12,9 @@ class ServerConnectionManager():
         self.max_connections = SERVER_CONFIG["max_connections"]
         self.buffer_size = SERVER_CONFIG["buffer_size"]
         self.server_socket = None
+        # Bufory ramek per połączenie - jeden recv() może zawierać część żądania lub kilka żądań
+        self._frame_readers = {}
+        self._readers_lock = threading.Lock()
         
     def start_server(self):
         """Uruchomienie serwera z ulepszoną obsługą błędów"""
@@ -65,61 +70,85 @@ class ServerConnectionManager():
             print(f"Nieoczekiwany błąd podczas akceptowania połączenia: {e}")
             raise
 
-    def handle_client(self, client_socket):     
+    def _get_frame_reader(self, client_socket):
+        with self._readers_lock:
+            reader = self._frame_readers.get(client_socket)
+            if reader is None:
+                reader = FrameReader(client_socket, self.buffer_size, MAX_REQUEST_SIZE)
+                self._frame_readers[client_socket] = reader
+            return reader
+
+    def release_client(self, client_socket):
+        """Zwalnia bufor ramek zamykanego połączenia"""
+        with self._readers_lock:
+            self._frame_readers.pop(client_socket, None)
+
+    def send_response(self, client_socket, response_dto):
+        """Wysyła odpowiedź DTO jako jedną ramkę"""
+        send_frame(client_socket, response_dto.to_json().encode("utf-8"))
+
+    def handle_client(self, client_socket):
+        """Odbiera jedno żądanie (ramkę); zwraca None gdy klient zamknął połączenie"""
         try:
-            data_string = client_socket.recv(self.buffer_size).decode("utf-8")
+            frame = self._get_frame_reader(client_socket).read_frame()
+            if frame is None:
+                return None
+            data_string = frame.decode("utf-8")
             
             # DEBUG - co dokładnie otrzymujemy
             print(f"🔍 DEBUG SERVER RECV - Raw data: '{data_string}'")
             print(f"🔍 DEBUG SERVER RECV - Data length: {len(data_string)}")
             print(f"🔍 DEBUG SERVER RECV - Data repr: {repr(data_string)}")
             
-            # Walidacja długości danych
-            if len(data_string.strip()) == 0:
-                print(f"🚨 SERVER - Otrzymano puste dane! Length: {len(data_string)}")
-                raise ValueError("Otrzymano puste dane")
-            if len(data_string) > MAX_REQUEST_SIZE:
-                raise ValueError(f"Dane przekraczają maksymalny rozmiar {MAX_REQUEST_SIZE}")
-            
-            try:
-                # Bezpieczne parsowanie JSON
-                parsed_data = json.loads(data_string)
-                print(f"🔍 DEBUG SERVER - Parsed JSON: {parsed_data}")
-                print(f"🔍 DEBUG SERVER - Type: {type(parsed_data)}")
-                
-                # Sprawdź format danych - tylko DTO
-                if isinstance(parsed_data, dict) and 'command' in parsed_data and 'data' in parsed_data:
-                    # Format RequestDTO: {"command": "help", "data": {}}
-                    command = parsed_data['command']
-                    data = parsed_data.get('data', {})
-                    print(f"🔍 DEBUG SERVER - RequestDTO format: command='{command}', data={data}")
-                else:
-                    raise ValueError("Nieprawidłowa struktura danych - oczekiwano formatu RequestDTO: {\"command\": ..., \"data\": ...}")
-                
-                # Walidacja komendy
-                if not isinstance(command, str) or len(command.strip()) == 0:
-                    raise ValueError("Komenda musi być niepustym tekstem")
-                if len(command) > MAX_COMMAND_LENGTH:
-                    raise ValueError(f"Komenda przekracza maksymalną długość {MAX_COMMAND_LENGTH}")
-                
-                # Walidacja danych
-                if not isinstance(data, dict):
-                    raise ValueError("Dane muszą być słownikiem")
-                
-                # Zwróć w formacie listy dla kompatybilności z resztą kodu
-                return [command, data]
-                
-            except json.JSONDecodeError as e:
-                print(f"Błąd podczas parsowania JSON: {e}")
-                raise ValueError("Nieprawidłowy format JSON")
-            except (ValueError, TypeError) as e:
-                print(f"Błąd walidacji danych: {e}")
-                raise 
+            return self.parse_request(data_string)
                 
         except UnicodeDecodeError as e:
             print(f"Błąd dekodowania danych: {e}")
             raise 
         except s.error as e:
             print(f"Błąd połączenia: {e}")
-            raise 
+            raise
 
+    def parse_request(self, data_string):
+        """Walidacja i parsowanie żądania RequestDTO - wspólne dla silnika blokującego i asyncio"""
+        # Walidacja długości danych
+        if len(data_string.strip()) == 0:
+            print(f"🚨 SERVER - Otrzymano puste dane! Length: {len(data_string)}")
+            raise ValueError("Otrzymano puste dane")
+        if len(data_string) > MAX_REQUEST_SIZE:
+            raise ValueError(f"Dane przekraczają maksymalny rozmiar {MAX_REQUEST_SIZE}")
+        
+        try:
+            # Bezpieczne parsowanie JSON
+            parsed_data = json.loads(data_string)
+            print(f"🔍 DEBUG SERVER - Parsed JSON: {parsed_data}")
+            print(f"🔍 DEBUG SERVER - Type: {type(parsed_data)}")
+            
+            # Sprawdź format danych - tylko DTO
+            if isinstance(parsed_data, dict) and 'command' in parsed_data and 'data' in parsed_data:
+                # Format RequestDTO: {"command": "help", "data": {}}
+                command = parsed_data['command']
+                data = parsed_data.get('data', {})
+                print(f"🔍 DEBUG SERVER - RequestDTO format: command='{command}', data={data}")
+            else:
+                raise ValueError("Nieprawidłowa struktura danych - oczekiwano formatu RequestDTO: {\"command\": ..., \"data\": ...}")
+            
+            # Walidacja komendy
+            if not isinstance(command, str) or len(command.strip()) == 0:
+                raise ValueError("Komenda musi być niepustym tekstem")
+            if len(command) > MAX_COMMAND_LENGTH:
+                raise ValueError(f"Komenda przekracza maksymalną długość {MAX_COMMAND_LENGTH}")
+            
+            # Walidacja danych
+            if not isinstance(data, dict):
+                raise ValueError("Dane muszą być słownikiem")
+            
+            # Zwróć w formacie listy dla kompatybilności z resztą kodu
+            return [command, data]
+            
+        except json.JSONDecodeError as e:
+            print(f"Błąd podczas parsowania JSON: {e}")
+            raise ValueError("Nieprawidłowy format JSON")
+        except (ValueError, TypeError) as e:
+            print(f"Błąd walidacji danych: {e}")
+            raise
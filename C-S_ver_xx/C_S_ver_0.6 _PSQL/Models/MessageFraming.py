@@ -0,0 +1,105 @@
+"""
+Ramkowanie wiadomości w strumieniu TCP
+
+TCP nie zachowuje granic wiadomości - jeden recv() może zwrócić fragment dokumentu JSON
+albo kilka dokumentów naraz. Każda wiadomość jest więc poprzedzona nagłówkiem z długością:
+
+    [4 bajty: długość payloadu (big-endian, unsigned)][payload: JSON w UTF-8]
+"""
+import struct
+from typing import Optional
+from config import SERVER_CONFIG, MAX_FRAME_SIZE
+
+FRAME_HEADER = struct.Struct("!I")
+MAX_RECV_CHUNK = 1024 * 1024
+
+
+def encode_frame(payload: bytes) -> bytes:
+    """Dodaje nagłówek z długością do payloadu"""
+    if len(payload) > 0xFFFFFFFF:
+        raise ValueError("Payload jest za duży dla nagłówka ramki")
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+class FrameDecoder:
+    """Bufor składający ramki z kolejnych fragmentów strumienia.
+
+    Dane są dopisywane do jednego bytearray (zamortyzowane O(1)), a odczytane
+    ramki przesuwają tylko offset - bufor jest kompaktowany, gdy skonsumowana
+    część przekroczy połowę. Duże payloady nie są więc wielokrotnie kopiowane.
+    """
+
+    def __init__(self, max_frame_size: int = MAX_FRAME_SIZE):
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()
+        self._offset = 0
+
+    def feed(self, data: bytes):
+        """Dopisuje odebrane bajty do bufora"""
+        self._buffer += data
+
+    @property
+    def buffered(self) -> int:
+        """Liczba bajtów w buforze, które nie zostały jeszcze odczytane jako ramka"""
+        return len(self._buffer) - self._offset
+
+    def bytes_needed(self) -> int:
+        """Minimalna liczba bajtów brakujących do skompletowania następnej ramki"""
+        available = self.buffered
+        if available < FRAME_HEADER.size:
+            return FRAME_HEADER.size - available
+        (length,) = FRAME_HEADER.unpack_from(self._buffer, self._offset)
+        return max(FRAME_HEADER.size + length - available, 0)
+
+    def next_frame(self) -> Optional[bytes]:
+        """Zwraca następną kompletną ramkę lub None, jeśli brakuje danych"""
+        available = self.buffered
+        if available < FRAME_HEADER.size:
+            return None
+
+        (length,) = FRAME_HEADER.unpack_from(self._buffer, self._offset)
+        if length > self.max_frame_size:
+            raise ValueError(f"Ramka przekracza maksymalny rozmiar {self.max_frame_size}")
+        if available < FRAME_HEADER.size + length:
+            return None
+
+        start = self._offset + FRAME_HEADER.size
+        frame = bytes(self._buffer[start:start + length])
+        self._offset = start + length
+
+        if self._offset == len(self._buffer):
+            self._buffer.clear()
+            self._offset = 0
+        elif self._offset > len(self._buffer) // 2:
+            del self._buffer[:self._offset]
+            self._offset = 0
+        return frame
+
+
+class FrameReader:
+    """Odczyt ramek z blokującego gniazda z buforowaniem między wywołaniami"""
+
+    def __init__(self, sock, buffer_size: int = None, max_frame_size: int = MAX_FRAME_SIZE):
+        self.sock = sock
+        self.buffer_size = buffer_size or SERVER_CONFIG["buffer_size"]
+        self.decoder = FrameDecoder(max_frame_size)
+
+    def read_frame(self) -> Optional[bytes]:
+        """Zwraca następną ramkę; None gdy druga strona zamknęła połączenie między ramkami"""
+        while True:
+            frame = self.decoder.next_frame()
+            if frame is not None:
+                return frame
+
+            to_read = min(max(self.buffer_size, self.decoder.bytes_needed()), MAX_RECV_CHUNK)
+            data = self.sock.recv(to_read)
+            if not data:
+                if self.decoder.buffered:
+                    raise ConnectionError("Połączenie zostało przerwane w trakcie odbierania ramki")
+                return None
+            self.decoder.feed(data)
+
+
+def send_frame(sock, payload: bytes):
+    """Wysyła kompletną ramkę (sendall gwarantuje wysłanie wszystkich bajtów)"""
+    sock.sendall(encode_frame(payload))
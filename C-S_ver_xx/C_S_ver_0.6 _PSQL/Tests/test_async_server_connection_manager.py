@@ -0,0 +1,118 @@
+import unittest
+import asyncio
+import threading
+from unittest.mock import Mock
+from BLL.AsyncServerConnectionManager import AsyncServerConnectionManager
+from Models.MessageProtocol import RequestDTO, ResponseDTO, MessageProtocol
+from Models.MessageFraming import FRAME_HEADER, encode_frame
+
+
+class TestAsyncServerConnectionManager(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """Uruchomienie serwera asyncio na losowym porcie"""
+        self.sessions = []
+        self.worker_threads = set()
+
+        def session_factory():
+            session = Mock()
+
+            def process_request(request_dto):
+                self.worker_threads.add(threading.get_ident())
+                return MessageProtocol.create_success_response(f"wykonano {request_dto.command}")
+
+            session.process_request.side_effect = process_request
+            self.sessions.append(session)
+            return session
+
+        self.server = AsyncServerConnectionManager(session_factory=session_factory, executor_workers=2)
+        self.server.port = 0
+        await self.server.start_server()
+        self.port = self.server._server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        await self.server.stop_server(timeout=1)
+
+    async def _read_response(self, reader):
+        (length,) = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+        return ResponseDTO.from_json((await reader.readexactly(length)).decode("utf-8"))
+
+    async def _send(self, writer, reader, request_dto):
+        writer.write(encode_frame(request_dto.to_json().encode("utf-8")))
+        await writer.drain()
+        return await self._read_response(reader)
+
+    async def test_request_is_processed_in_executor(self):
+        """Test przetworzenia żądania poza wątkiem pętli zdarzeń"""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        response = await self._send(writer, reader, RequestDTO(command="help", data={}))
+        writer.close()
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.message, "wykonano help")
+        self.assertNotIn(threading.get_ident(), self.worker_threads)
+
+    async def test_each_connection_gets_own_session(self):
+        """Test osobnej sesji dla każdego połączenia"""
+        connections = [await asyncio.open_connection("127.0.0.1", self.port) for _ in range(3)]
+        for reader, writer in connections:
+            await self._send(writer, reader, RequestDTO(command="help", data={}))
+        for _, writer in connections:
+            writer.close()
+
+        self.assertEqual(len(self.sessions), 3)
+
+    async def test_many_idle_connections(self):
+        """Test utrzymywania wielu bezczynnych połączeń bez dodatkowych wątków"""
+        threads_before = threading.active_count()
+        connections = [await asyncio.open_connection("127.0.0.1", self.port) for _ in range(50)]
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(self.server.active_connections, 50)
+        self.assertLessEqual(threading.active_count(), threads_before + 2)
+        for _, writer in connections:
+            writer.close()
+
+    async def test_logout_closes_connection(self):
+        """Test zamknięcia połączenia po komendzie logout"""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        response = await self._send(writer, reader, RequestDTO(command="logout", data={}))
+
+        self.assertTrue(response.success)
+        self.assertEqual(await reader.read(), b"")
+        self.sessions[0].process_request.assert_not_called()
+        writer.close()
+
+    async def test_invalid_request_returns_error(self):
+        """Test odpowiedzi z błędem dla nieprawidłowego żądania"""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(encode_frame(b"not json"))
+        await writer.drain()
+        response = await self._read_response(reader)
+        writer.close()
+
+        self.assertFalse(response.success)
+        self.assertEqual(response.error_code, "INVALID_REQUEST")
+
+    async def test_pipelined_frames_in_one_segment(self):
+        """Test kilku żądań wysłanych w jednym segmencie TCP"""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(b"".join(encode_frame(RequestDTO(command=c, data={}).to_json().encode("utf-8"))
+                              for c in ("help", "read", "read-a")))
+        await writer.drain()
+        responses = [await self._read_response(reader) for _ in range(3)]
+        writer.close()
+
+        self.assertEqual([r.message for r in responses], ["wykonano help", "wykonano read", "wykonano read-a"])
+
+    async def test_oversized_frame_closes_connection(self):
+        """Test zamknięcia połączenia dla ramki większej niż MAX_REQUEST_SIZE"""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(FRAME_HEADER.pack(10 ** 9))
+        await writer.drain()
+
+        self.assertEqual(await reader.read(), b"")
+        writer.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
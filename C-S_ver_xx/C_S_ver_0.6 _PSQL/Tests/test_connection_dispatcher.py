@@ -0,0 +1,121 @@
+import unittest
+import threading
+from unittest.mock import Mock
+from BLL.ConnectionDispatcher import ConnectionDispatcher
+from Models.MessageProtocol import MessageProtocol
+
+
+class TestConnectionDispatcher(unittest.TestCase):
+    def setUp(self):
+        """Przygotowanie środowiska testowego przed każdym testem"""
+        self.server = Mock()
+        self.session = Mock()
+        self.session.process_request.return_value = MessageProtocol.create_success_response("OK")
+        self.dispatcher = ConnectionDispatcher(self.server, pool_size=2,
+                                               session_factory=lambda: self.session)
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście"""
+        self.dispatcher.shutdown(timeout=1)
+
+    def test_serve_client_processes_requests_until_disconnect(self):
+        """Test obsługi kolejnych żądań aż do rozłączenia klienta"""
+        client_socket = Mock()
+        self.server.handle_client.side_effect = [["help", {}], ["read", {}], None]
+
+        self.dispatcher.serve_client(client_socket, ("127.0.0.1", 1))
+
+        self.assertEqual(self.session.process_request.call_count, 2)
+        self.assertEqual(self.server.send_response.call_count, 2)
+
+    def test_serve_client_logout_ends_session(self):
+        """Test zakończenia sesji po komendzie logout"""
+        client_socket = Mock()
+        self.server.handle_client.side_effect = [["logout", {}], ["help", {}]]
+
+        self.dispatcher.serve_client(client_socket, ("127.0.0.1", 1))
+
+        self.session.process_request.assert_not_called()
+        self.server.send_response.assert_called_once()
+
+    def test_each_connection_gets_own_session(self):
+        """Test tworzenia osobnej sesji dla każdego połączenia"""
+        sessions = []
+
+        def factory():
+            session = Mock()
+            sessions.append(session)
+            return session
+
+        dispatcher = ConnectionDispatcher(self.server, pool_size=2, session_factory=factory)
+        self.server.handle_client.return_value = None
+        dispatcher.dispatch(Mock(), ("127.0.0.1", 1))
+        dispatcher.dispatch(Mock(), ("127.0.0.1", 2))
+        dispatcher.shutdown(timeout=1)
+
+        self.assertEqual(len(sessions), 2)
+        self.assertIsNot(sessions[0], sessions[1])
+
+    def test_clients_are_served_concurrently(self):
+        """Test równoległej obsługi dwóch klientów"""
+        # Dwa wątki robocze + wątek testu - bariera przejdzie tylko przy równoległej obsłudze
+        both_connected = threading.Barrier(3, timeout=2)
+
+        def handle_client(client_socket):
+            both_connected.wait()
+            return None
+
+        self.server.handle_client.side_effect = handle_client
+        first, second = Mock(), Mock()
+        self.dispatcher.dispatch(first, ("127.0.0.1", 1))
+        self.dispatcher.dispatch(second, ("127.0.0.1", 2))
+        both_connected.wait()
+        self.dispatcher.shutdown(timeout=2)
+
+        self.assertFalse(both_connected.broken)
+        first.close.assert_called()
+        second.close.assert_called()
+
+    def test_dispatch_rejects_when_pool_is_full(self):
+        """Test odrzucenia klienta gdy wszystkie wątki są zajęte"""
+        release = threading.Event()
+        self.server.handle_client.side_effect = lambda sock: release.wait(2) and None
+
+        self.assertTrue(self.dispatcher.dispatch(Mock(), ("127.0.0.1", 1)))
+        self.assertTrue(self.dispatcher.dispatch(Mock(), ("127.0.0.1", 2)))
+        rejected = Mock()
+        self.assertFalse(self.dispatcher.dispatch(rejected, ("127.0.0.1", 3), timeout=0.1))
+        rejected.close.assert_called_once()
+        release.set()
+
+    def test_shutdown_closes_active_connections(self):
+        """Test zamknięcia aktywnych połączeń po przekroczeniu czasu zamykania"""
+        started = threading.Event()
+        closed = threading.Event()
+        client_socket = Mock()
+        client_socket.shutdown.side_effect = lambda how: closed.set()
+
+        def handle_client(sock):
+            started.set()
+            closed.wait(2)
+            return None
+
+        self.server.handle_client.side_effect = handle_client
+        self.dispatcher.dispatch(client_socket, ("127.0.0.1", 1))
+        started.wait(1)
+        self.dispatcher.shutdown(timeout=0.2)
+
+        client_socket.shutdown.assert_called_once()
+        self.assertEqual(self.dispatcher.active_connections, 0)
+
+    def test_dispatch_after_shutdown_is_rejected(self):
+        """Test odrzucenia połączeń po zamknięciu dispatchera"""
+        self.dispatcher.shutdown(timeout=1)
+        client_socket = Mock()
+
+        self.assertFalse(self.dispatcher.dispatch(client_socket, ("127.0.0.1", 1)))
+        client_socket.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import json
+import socket
+from unittest.mock import Mock
+from Models.MessageFraming import FrameDecoder, FrameReader, FRAME_HEADER, encode_frame, send_frame
+
+
+class TestFrameDecoder(unittest.TestCase):
+    def test_encode_frame_adds_length_header(self):
+        """Test nagłówka z długością payloadu"""
+        frame = encode_frame(b"abc")
+        self.assertEqual(frame, FRAME_HEADER.pack(3) + b"abc")
+
+    def test_partial_reads(self):
+        """Test składania ramki z pojedynczych bajtów"""
+        decoder = FrameDecoder()
+        frame = encode_frame(b'{"command": "help"}')
+        for byte in frame[:-1]:
+            decoder.feed(bytes([byte]))
+            self.assertIsNone(decoder.next_frame())
+        decoder.feed(frame[-1:])
+
+        self.assertEqual(decoder.next_frame(), b'{"command": "help"}')
+        self.assertEqual(decoder.buffered, 0)
+
+    def test_multiple_frames_in_one_segment(self):
+        """Test kilku ramek w jednym fragmencie strumienia"""
+        decoder = FrameDecoder()
+        decoder.feed(encode_frame(b"one") + encode_frame(b"two") + encode_frame(b"thr"))
+
+        self.assertEqual(decoder.next_frame(), b"one")
+        self.assertEqual(decoder.next_frame(), b"two")
+        self.assertEqual(decoder.next_frame(), b"thr")
+        self.assertIsNone(decoder.next_frame())
+
+    def test_empty_payload(self):
+        """Test ramki o zerowej długości"""
+        decoder = FrameDecoder()
+        decoder.feed(encode_frame(b""))
+        self.assertEqual(decoder.next_frame(), b"")
+
+    def test_bytes_needed(self):
+        """Test liczby brakujących bajtów"""
+        decoder = FrameDecoder()
+        self.assertEqual(decoder.bytes_needed(), FRAME_HEADER.size)
+        decoder.feed(encode_frame(b"x" * 100)[:10])
+        self.assertEqual(decoder.bytes_needed(), 94)
+
+    def test_frame_too_large(self):
+        """Test odrzucenia ramki przekraczającej limit"""
+        decoder = FrameDecoder(max_frame_size=10)
+        decoder.feed(FRAME_HEADER.pack(11))
+        with self.assertRaises(ValueError):
+            decoder.next_frame()
+
+
+class TestFrameReader(unittest.TestCase):
+    def test_read_frame_from_split_segments(self):
+        """Test odczytu ramki przychodzącej w wielu segmentach"""
+        payload = json.dumps({"data": "x" * 5000}).encode("utf-8")
+        frame = encode_frame(payload)
+        sock = Mock()
+        sock.recv.side_effect = [frame[:3], frame[3:1000], frame[1000:], b""]
+        reader = FrameReader(sock, buffer_size=1024)
+
+        self.assertEqual(reader.read_frame(), payload)
+        self.assertIsNone(reader.read_frame())
+
+    def test_large_frame_is_read_with_large_recv(self):
+        """Test odczytu payloadu dużo większego niż buffer_size małą liczbą wywołań recv"""
+        payload = b"y" * (512 * 1024)
+        left, right = socket.socketpair()
+        try:
+            send_frame(left, payload)
+            reader = FrameReader(right, buffer_size=1024)
+            self.assertEqual(reader.read_frame(), payload)
+        finally:
+            left.close()
+            right.close()
+
+    def test_connection_closed_mid_frame(self):
+        """Test przerwania połączenia w trakcie ramki"""
+        sock = Mock()
+        sock.recv.side_effect = [encode_frame(b"abcdef")[:6], b""]
+        reader = FrameReader(sock, buffer_size=1024)
+
+        with self.assertRaises(ConnectionError):
+            reader.read_frame()
+
+
+if __name__ == '__main__':
+    unittest.main()
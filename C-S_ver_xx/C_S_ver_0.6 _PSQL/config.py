@@ -2,10 +2,16 @@
 SERVER_CONFIG = {
     "host": "127.0.0.1",
     "port":  64623,
-    "max_connections": 5,
-    "buffer_size": 1024
+    "max_connections": 128,    # kolejka listen - klienci czekający na accept
+    "buffer_size": 1024,
+    "worker_pool_size": 200,   # maksymalna liczba jednocześnie obsługiwanych klientów
+    "shutdown_timeout": 10.0,  # czas na dokończenie aktywnych sesji przy zamykaniu serwera
+    "executor_workers": 32     # wątki dla blokujących operacji na bazie w silniku asyncio
 }
 
+# Silnik serwera
+SERVER_ENGINE = "THREADED"  # "THREADED" (ServerConnectionManager + pula wątków), "ASYNCIO" (AsyncServerConnectionManager)
+
 ROLE_PERMISSIONS = {
         'admin': {
             "send"   : True,
@@ -78,6 +84,7 @@ MIN_PASSWORD_LENGTH = 2
 MAX_MESSAGE_LENGTH = 255
 MAX_NEW_MESSAGE_STORAGE = 5
 MAX_REQUEST_SIZE = 2048
+MAX_FRAME_SIZE = 16 * 1024 * 1024  # maksymalny rozmiar ramki odpowiedzi (nagłówek długości + JSON)
 MAX_COMMAND_LENGTH = 50
 MAX_USERNAME_LENGTH = 50
 MAX_PASSWORD_LENGTH = 100